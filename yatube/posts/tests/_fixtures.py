@@ -0,0 +1,98 @@
+from functools import lru_cache
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.test import Client
+from django.urls import reverse
+
+from ..models import Post, Group
+
+User = get_user_model()
+
+
+# reverse() каждый раз обходит URLResolver, поэтому результаты
+# кэшируются: одинаковые адреса не резолвятся повторно в других классах.
+@lru_cache(maxsize=None)
+def index_url():
+    return reverse('posts:index')
+
+
+@lru_cache(maxsize=None)
+def post_detail_url(post_id):
+    return reverse('posts:post_detail', kwargs={'post_id': post_id})
+
+
+@lru_cache(maxsize=None)
+def group_list_url(slug):
+    return reverse('posts:group_list', kwargs={'slug': slug})
+
+
+@lru_cache(maxsize=None)
+def profile_url(username):
+    return reverse('posts:profile', kwargs={'username': username})
+
+
+@lru_cache(maxsize=None)
+def post_create_url():
+    return reverse('posts:post_create')
+
+
+@lru_cache(maxsize=None)
+def post_edit_url(post_id):
+    return reverse('posts:post_edit', kwargs={'post_id': post_id})
+
+
+@lru_cache(maxsize=None)
+def follow_index_url():
+    return reverse('posts:follow_index')
+
+
+class BaseFixtureMixin:
+    """Общие фикстуры для тестов приложения posts.
+
+    Пользователь, группа, пост и словари адресов создаются один раз
+    на класс через setUpTestData: Django откатывает транзакцию после
+    каждого теста вместо повторных INSERT в setUpClass.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Прогреваем кэш ContentType, чтобы force_login и создание
+        # объектов в тестах не ходили за ним в базу по одному.
+        ContentType.objects.get_for_models(*apps.get_models())
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # User/Group/Post — разные модели, bulk_create их не объединит,
+        # а на sqlite в Django 2.2 он не вернул бы pk. Отдельные create()
+        # уже выполняются в общей транзакции класса без savepoint'ов.
+        cls.user = User.objects.create_user(username='auth')
+        cls.group = Group.objects.create(
+            title='Тестовая группа',
+            slug='test-slug',
+            description='Тестовое описание',
+        )
+        cls.post = Post.objects.create(
+            text='Тестовый текст',
+            author=cls.user,
+            group=cls.group,
+        )
+        cls.public_urls = {
+            index_url(): 'posts/index.html',
+            post_detail_url(cls.post.id): 'posts/post_detail.html',
+            group_list_url(cls.group.slug): 'posts/group_list.html',
+            profile_url(cls.user.username): 'posts/profile.html',
+        }
+        cls.private_urls = {
+            post_create_url(): 'posts/create_post.html',
+            post_edit_url(cls.post.id): 'posts/create_post.html',
+            follow_index_url(): 'posts/follow.html',
+        }
+        # Клиенты создаются и авторизуются один раз на класс:
+        # force_login пишет сессию в базу при каждом вызове.
+        cls.guest_client = Client()
+        cls.authorized_client = Client()
+        cls.authorized_client.force_login(cls.user)
@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from django.utils.deconstruct import deconstructible
+
+
+@deconstructible
+class InMemoryStorage(Storage):
+    """Держит загруженные файлы в словаре процесса вместо диска.
+
+    В Django 2.2 нет штатного InMemoryStorage, поэтому тесты, которым
+    не важно физическое хранение картинок, используют это хранилище и
+    не создают временный MEDIA_ROOT.
+    """
+
+    _files = {}
+
+    def _open(self, name, mode='rb'):
+        return ContentFile(self._files[name], name=name)
+
+    def _save(self, name, content):
+        content.seek(0)
+        self._files[name] = content.read()
+        return name
+
+    def delete(self, name):
+        self._files.pop(name, None)
+
+    def exists(self, name):
+        return name in self._files
+
+    def size(self, name):
+        return len(self._files[name])
+
+    def url(self, name):
+        return settings.MEDIA_URL + name
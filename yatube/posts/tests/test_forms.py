@@ -1,16 +1,43 @@
+import os
 import shutil
 import tempfile
 
+from django import forms
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import Client, TestCase, override_settings
+from django.test import Client, SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 
+from ..forms import PostForm, CommentForm
 from ..models import Post, Group, Comment
 
 User = get_user_model()
-TEMP_MEDIA_ROOT = tempfile.mkdtemp(dir=settings.BASE_DIR)
+TEMP_MEDIA_ROOT = tempfile.mkdtemp(
+    dir=settings.BASE_DIR,
+    suffix=os.environ.get('PYTEST_XDIST_WORKER', ''),
+)
+
+
+class FormShapeTests(SimpleTestCase):
+    """Проверяем структуру форм без базы и транзакций."""
+
+    def test_post_form_fields(self):
+        """Форма PostForm содержит ожидаемые поля."""
+        form = PostForm()
+        form_fields = {
+            'text': forms.CharField,
+            'group': forms.ModelChoiceField,
+            'image': forms.ImageField,
+        }
+        for value, expected in form_fields.items():
+            with self.subTest(value=value):
+                self.assertIsInstance(form.fields[value], expected)
+
+    def test_comment_form_fields(self):
+        """Форма CommentForm содержит ожидаемые поля."""
+        form = CommentForm()
+        self.assertIsInstance(form.fields['text'], forms.CharField)
 
 
 @override_settings(MEDIA_ROOT=TEMP_MEDIA_ROOT)
@@ -0,0 +1,68 @@
+"""Проверки доступности адресов в pytest-стиле.
+
+Каждый адрес — отдельный параметризованный тест, поэтому pytest-xdist
+раскидывает их по воркерам, в отличие от subTest-циклов внутри одного
+метода TestCase. Шаблоны и редиректы проверяют классы в test_urls.py
+и test_views.py.
+"""
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from posts.models import Post, Group
+
+User = get_user_model()
+
+PUBLIC_URLS = (
+    ('posts:index', None),
+    ('posts:post_detail', 'post_id'),
+    ('posts:group_list', 'slug'),
+    ('posts:profile', 'username'),
+)
+PRIVATE_URLS = (
+    ('posts:post_create', None),
+    ('posts:post_edit', 'post_id'),
+    ('posts:follow_index', None),
+)
+
+
+def _resolve(name, url_kwarg, post):
+    kwargs = {
+        'post_id': {'post_id': post.id},
+        'slug': {'slug': post.group.slug},
+        'username': {'username': post.author.username},
+    }.get(url_kwarg)
+    return reverse(name, kwargs=kwargs)
+
+
+@pytest.fixture
+def post(db):
+    user = User.objects.create_user(username='auth')
+    group = Group.objects.create(
+        title='Тестовая группа',
+        slug='test-slug',
+        description='Тестовое описание',
+    )
+    return Post.objects.create(text='Тестовый текст',
+                               author=user,
+                               group=group)
+
+
+@pytest.fixture
+def author_client(client, post):
+    client.force_login(post.author)
+    return client
+
+
+@pytest.mark.parametrize('name,url_kwarg', PUBLIC_URLS)
+def test_public_url_exists_for_guest(client, post, name, url_kwarg):
+    response = client.get(_resolve(name, url_kwarg, post))
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.parametrize('name,url_kwarg', PUBLIC_URLS + PRIVATE_URLS)
+def test_url_exists_for_authorized(author_client, post, name, url_kwarg):
+    response = author_client.get(_resolve(name, url_kwarg, post))
+    assert response.status_code == HTTPStatus.OK
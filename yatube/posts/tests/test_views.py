@@ -1,82 +1,46 @@
-import shutil
-import tempfile
-from http import HTTPStatus
-
-from django import forms
-from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 
+from ._fixtures import BaseFixtureMixin
+from ..forms import PostForm
 from ..models import Post, Group, Follow
 
 User = get_user_model()
-TEMP_MEDIA_ROOT = tempfile.mkdtemp(dir=settings.BASE_DIR)
-
-
-@override_settings(MEDIA_ROOT=TEMP_MEDIA_ROOT)
-class PostViewTests(TestCase):
+IN_MEMORY_STORAGE = 'posts.tests._storage.InMemoryStorage'
+SMALL_GIF = (
+    b'\x47\x49\x46\x38\x39\x61\x02\x00'
+    b'\x01\x00\x80\x00\x00\x00\x00\x00'
+    b'\xFF\xFF\xFF\x21\xF9\x04\x00\x00'
+    b'\x00\x00\x00\x2C\x00\x00\x00\x00'
+    b'\x02\x00\x01\x00\x00\x02\x02\x0C'
+    b'\x0A\x00\x3B'
+)
+
+
+@override_settings(DEFAULT_FILE_STORAGE=IN_MEMORY_STORAGE,
+                   THUMBNAIL_STORAGE=IN_MEMORY_STORAGE)
+class PostViewTests(BaseFixtureMixin, TestCase):
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
-        cls.small_gif = (
-            b'\x47\x49\x46\x38\x39\x61\x02\x00'
-            b'\x01\x00\x80\x00\x00\x00\x00\x00'
-            b'\xFF\xFF\xFF\x21\xF9\x04\x00\x00'
-            b'\x00\x00\x00\x2C\x00\x00\x00\x00'
-            b'\x02\x00\x01\x00\x00\x02\x02\x0C'
-            b'\x0A\x00\x3B'
-        )
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user_2 = User.objects.create_user(username='Test_user')
         cls.uploaded = SimpleUploadedFile(
             name='small.gif',
-            content=cls.small_gif,
+            content=SMALL_GIF,
             content_type='image/gif'
         )
-        cls.user = User.objects.create_user(username='auth')
-        cls.user_2 = User.objects.create_user(username='Test_user')
-        cls.group = Group.objects.create(
-            title='Тестовая группа',
-            slug='test-slug',
-            description='Тестовое описание',
-        )
-        cls.post = Post.objects.create(
-            text='Тестовый текст',
-            author=cls.user,
-            group=cls.group,
-            image=cls.uploaded,
-        )
-        cls.public_urls = {
-            reverse('posts:index'): 'posts/index.html',
-            reverse('posts:post_detail', kwargs={'post_id':
-                    cls.post.id}): 'posts/post_detail.html',
-            reverse('posts:group_list', kwargs={'slug':
-                    cls.group.slug}): 'posts/group_list.html',
-            reverse('posts:profile', kwargs={'username':
-                    cls.post.author}): 'posts/profile.html',
-        }
-        cls.private_urls = {
-            reverse('posts:post_create'): 'posts/create_post.html',
-            reverse('posts:post_edit', kwargs={'post_id':
-                    cls.post.id}): 'posts/create_post.html',
-            reverse('posts:follow_index'): 'posts/follow.html',
-        }
-
-    @classmethod
-    def tearDownClass(cls):
-        super().tearDownClass()
-        shutil.rmtree(TEMP_MEDIA_ROOT, ignore_errors=True)
-
-    def setUp(self):
-        self.guest_client = Client()
-        self.authorized_client = Client()
-        self.authorized_client.force_login(PostViewTests.user)
-        cache.clear()
+        cls.post.image = cls.uploaded
+        cls.post.save()
 
     def test_pages_uses_correct_public_url(self):
         """URL-адрес использует соответствующий шаблон.
         В том числе и для пользователя для public_url"""
+        # Главная страница закэширована cache_page — без очистки
+        # assertTemplateUsed не увидит рендер шаблона.
+        cache.clear()
         for reverse_name, template in self.public_urls.items():
             with self.subTest(reverse_name=reverse_name):
                 response = self.guest_client.get(reverse_name)
@@ -93,44 +57,59 @@ class PostViewTests(TestCase):
     def test_page_create_show_correct_context(self):
         """Проверяем словарь контекста для create"""
         response = self.authorized_client.get(reverse('posts:post_create'))
-        form_fields = {
-            'text': forms.fields.CharField,
-            'group': forms.fields.ChoiceField,
-            'image': forms.fields.ImageField,
-        }
-        for value, expected in form_fields.items():
-            with self.subTest(value=value):
-                form_field = response.context.get('form').fields.get(value)
-                self.assertIsInstance(form_field, expected)
+        # Набор полей формы проверяет FormShapeTests в test_forms.py,
+        # здесь важно только то, что view кладёт PostForm в контекст.
+        self.assertIsInstance(response.context.get('form'), PostForm)
 
     def test_posts_index_page_show_correct_context(self):
         """Проверяем, что словарь context страницы index
         содержит ожидаемый контекст"""
-        response = self.guest_client.get(reverse('posts:index'))
-        expected = list(Post.objects.all()[:10])
-        self.assertEqual(list(response.context['page_obj']), expected)
+        cache.clear()
+        # Первый запрос прогревает кэш миниатюр sorl; бюджет запросов
+        # меряем по '?page=1', т.к. cache_page ключует ответ по URL.
+        self.guest_client.get(reverse('posts:index'))
+        with self.assertNumQueries(2):
+            response = self.guest_client.get(
+                reverse('posts:index') + '?page=1'
+            )
+        expected_pks = list(Post.objects.values_list('pk', flat=True)[:10])
+        actual_pks = [post.pk for post in response.context['page_obj']]
+        self.assertEqual(actual_pks, expected_pks)
         self.assertEqual(response.context['page_obj'][0].image,
                          self.post.image)
 
     def test_posts_group_list_pages_show_correct_context(self):
         """Проверяем, что словарь context страницы group_list
         содержит ожидаемый контекст"""
-        response = self.authorized_client.get(
-            reverse('posts:group_list', kwargs={'slug': self.group.slug})
+        # Первый запрос прогревает кэш миниатюр sorl, второй меряется.
+        address = reverse('posts:group_list',
+                          kwargs={'slug': self.group.slug})
+        self.authorized_client.get(address)
+        with self.assertNumQueries(5):
+            response = self.authorized_client.get(address)
+        expected_pks = list(
+            Post.objects.filter(group_id=self.group.id)
+            .values_list('pk', flat=True)
         )
-        expected = list(Post.objects.filter(group_id=self.group.id))
-        self.assertEqual(list(response.context['page_obj']), expected)
+        actual_pks = [post.pk for post in response.context['page_obj']]
+        self.assertEqual(actual_pks, expected_pks)
         self.assertEqual(response.context['page_obj'][0].image,
                          self.post.image)
 
     def test_posts_profile_pages_show_correct_context(self):
         """Проверяем, что словарь context страницы profile
         содержит ожидаемый контекст"""
-        response = self.guest_client.get(
-            reverse('posts:profile', args=(self.post.author,))
+        # Первый запрос прогревает кэш миниатюр sorl, второй меряется.
+        address = reverse('posts:profile', args=(self.post.author,))
+        self.guest_client.get(address)
+        with self.assertNumQueries(4):
+            response = self.guest_client.get(address)
+        expected_pks = list(
+            Post.objects.filter(author_id=self.user.id)
+            .values_list('pk', flat=True)[:10]
         )
-        expected = list(Post.objects.filter(author_id=self.user.id)[:10])
-        self.assertEqual(list(response.context['page_obj']), expected)
+        actual_pks = [post.pk for post in response.context['page_obj']]
+        self.assertEqual(actual_pks, expected_pks)
         self.assertEqual(response.context['page_obj'][0].image,
                          self.post.image)
 
@@ -147,46 +126,29 @@ class PostViewTests(TestCase):
         self.assertEqual(response.context.get('post').comments,
                          self.post.comments)
 
-    def tests_posts_post_exist_authorized_client_private_url(self):
-        """Проверяем доступность authorized_client
-        для private_urls"""
-        for address, template in self.private_urls.items():
-            with self.subTest(address=address):
-                response = self.authorized_client.get(address)
-                self.assertEqual(response.status_code, HTTPStatus.OK)
-
-    def tests_posts_post_exist_authorized_client_public_url(self):
-        """Проверяем доступность authorized_client
-        для public_urls"""
-        for address, template in self.public_urls.items():
-            with self.subTest(address=address):
-                response = self.authorized_client.get(address)
-                self.assertEqual(response.status_code, HTTPStatus.OK)
-
-    def tests_posts_post_exist_guest_client_public_urls(self):
-        """Проверяем доступность guest_client для public_urls"""
-        for address, template in self.public_urls.items():
-            with self.subTest(address=address):
-                response = self.guest_client.get(address)
-                self.assertEqual(response.status_code, HTTPStatus.OK)
-
     def tests_posts_post_exist_guest_client_private_urls(self):
         """Проверяем redirect для guest_client_private_urls"""
         for address, template in self.private_urls.items():
             with self.subTest(address=address):
                 response = self.guest_client.get(address)
-                self.assertRedirects(response, f'/auth/login/?next={address}')
+                # Сама страница логина здесь не интересна — достаточно
+                # кода 302 и заголовка Location, без второго запроса.
+                self.assertRedirects(response,
+                                     f'/auth/login/?next={address}',
+                                     fetch_redirect_response=False)
 
     def test_posts_added_correctly(self):
         """Пост при создании добавлен корректно"""
+        cache.clear()
+        expected_post = Post.objects.get(group=self.post.group)
         posts_urls = {
-            reverse('posts:index'): Post.objects.get(group=self.post.group),
+            reverse('posts:index'): expected_post,
             reverse(
                 'posts:group_list', kwargs={'slug': self.group.slug}
-            ): Post.objects.get(group=self.post.group),
+            ): expected_post,
             reverse(
                 'posts:profile', kwargs={'username': self.post.author}
-            ): Post.objects.get(group=self.post.group)
+            ): expected_post,
         }
         for value, expected in posts_urls.items():
             with self.subTest(value=value):
@@ -209,12 +171,13 @@ POSTS_TESTS_COUNT: int = 13
 
 
 class PaginatorViewsTest(TestCase):
-    def setUp(self):
-        self.guest_client = Client()
-        self.user = User.objects.create_user(username='auth')
-        self.authorized_client = Client()
-        self.authorized_client.force_login(self.user)
-        self.group = Group.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.guest_client = Client()
+        cls.user = User.objects.create_user(username='auth')
+        cls.authorized_client = Client()
+        cls.authorized_client.force_login(cls.user)
+        cls.group = Group.objects.create(
             title='Тестовая группа',
             slug='test_group'
         )
@@ -222,60 +185,60 @@ class PaginatorViewsTest(TestCase):
         for i in range(POSTS_TESTS_COUNT):
             bulk_post.append(
                 Post(text=f'Тестовый текст {i}',
-                     group=self.group,
-                     author=self.user,
+                     group=cls.group,
+                     author=cls.user,
                      )
             )
-        Post.objects.bulk_create(bulk_post)
+        Post.objects.bulk_create(bulk_post, batch_size=POSTS_TESTS_COUNT)
 
     def test_first_page_contains_ten_records(self):
         cache.clear()
-        response = self.client.get(reverse('posts:index'))
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('posts:index'))
         # Проверка: количество постов на первой странице равно 10.
         self.assertEqual(len(response.context['page_obj']), 10)
 
     def test_second_page_contains_three_records(self):
         # Проверка: на второй странице должно быть три поста.
-        response = self.client.get(reverse('posts:index') + '?page=2')
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('posts:index') + '?page=2')
         self.assertEqual(len(response.context['page_obj']), 3)
 
 
-class FollowTest(TestCase):
+class FollowTest(BaseFixtureMixin, TestCase):
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
+        super().setUpTestData()
         cls.post_author = User.objects.create(username='author')
         cls.post_follower = User.objects.create(username='follower')
         cls.post = Post.objects.create(text='Подпишись на меня',
                                        author=cls.post_author,)
-
-    def setUp(self):
-        self.authorized_client = Client()
-        self.authorized_client.force_login(self.post_follower)
-        self.follower_client = Client()
-        self.follower_client.force_login(self.post_author)
-        cache.clear()
+        cls.authorized_client = Client()
+        cls.authorized_client.force_login(cls.post_follower)
+        cls.follower_client = Client()
+        cls.follower_client.force_login(cls.post_author)
 
     def test_follow_on_user(self):
         """Проверка подписки на пользователя."""
-        count_follow = Follow.objects.count()
         self.follower_client.post(
             reverse('posts:profile_follow',
                     kwargs={'username': self.post_follower}))
-        follow = Follow.objects.all().latest('id')
-        self.assertEqual(Follow.objects.count(), count_follow + 1)
-        self.assertEqual(follow.author_id, self.post_follower.id)
-        self.assertEqual(follow.user_id, self.post_author.id)
+        self.assertTrue(
+            Follow.objects.filter(user=self.post_author,
+                                  author=self.post_follower).exists()
+        )
 
     def test_unfollow_on_user(self):
         """Проверка отписки от пользователя."""
         Follow.objects.create(user=self.post_author,
                               author=self.post_follower)
-        count_follow = Follow.objects.count()
         self.follower_client.post(
             reverse('posts:profile_unfollow',
                     kwargs={'username': self.post_follower}))
-        self.assertEqual(Follow.objects.count(), count_follow - 1)
+        self.assertFalse(
+            Follow.objects.filter(user=self.post_author,
+                                  author=self.post_follower).exists()
+        )
 
     def test_follow_on_authors(self):
         """Проверка записей у тех кто подписан."""
@@ -283,7 +246,10 @@ class FollowTest(TestCase):
                                    text="Подпишись на меня")
         Follow.objects.create(user=self.post_follower,
                               author=self.post_author)
-        response = self.authorized_client.get(reverse('posts:follow_index'))
+        with self.assertNumQueries(4):
+            response = self.authorized_client.get(
+                reverse('posts:follow_index')
+            )
         self.assertIn(post, response.context['page_obj'].object_list)
 
     def test_notfollow_on_authors(self):
@@ -304,29 +270,10 @@ class FollowTest(TestCase):
         self.assertFalse(follow.exists())
 
 
-class TestCache(TestCase):
-    @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
-        cls.user = User.objects.create_user(username='auth')
-        cls.group = Group.objects.create(
-            title='title',
-            slug='slug',
-            description='description'
-        )
-        cls.post = Post.objects.create(
-            text='Текст поста',
-            group=cls.group,
-            author=cls.user,
-        )
-
-    def setUp(self):
-        self.authorized_client = Client()
-        self.authorized_client.force_login(self.user)
-        cache.clear()
-
+class TestCache(BaseFixtureMixin, TestCase):
     def test_cache_index(self):
         """Проверка хранения и очищения кэша для index."""
+        cache.clear()
         response = self.authorized_client.get(reverse('posts:index'))
         posts = response.content
         Post.objects.create(text='Текст поста',
@@ -12,7 +12,7 @@ TEXT_CUT: int = 30
 
 @cache_page(20, key_prefix='index_page')
 def index(request):
-    post_list = Post.objects.all()
+    post_list = Post.objects.select_related('author', 'group')
     paginator = Paginator(post_list, POSTS_PER_PAGE)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
@@ -26,7 +26,7 @@ def index(request):
 
 def group_posts(request, slug):
     group = get_object_or_404(Group, slug=slug)
-    post_list = group.posts.all()
+    post_list = group.posts.select_related('author', 'group')
     paginator = Paginator(post_list, POSTS_PER_PAGE)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
@@ -44,7 +44,7 @@ def profile(request, username):
         request.user.is_authenticated
         and request.user.follower.filter(author=author).exists()
     )
-    posts_list = author.posts.all()
+    posts_list = author.posts.select_related('author', 'group')
     count = posts_list.count()
     paginator = Paginator(posts_list, POSTS_PER_PAGE)
     page_number = request.GET.get('page')
@@ -65,7 +65,7 @@ def post_detail(request, post_id):
     post_title = post.text[:TEXT_CUT]
     author = post.author
     author_posts_count = author.posts.all().count()
-    comments = post.comments.all()
+    comments = post.comments.select_related('author')
     form = CommentForm()
     context = {
         'post': post,
@@ -137,7 +137,9 @@ def add_comment(request, post_id):
 
 @login_required
 def follow_index(request):
-    post_list = Post.objects.filter(author__following__user=request.user)
+    post_list = Post.objects.filter(
+        author__following__user=request.user
+    ).select_related('author', 'group')
     paginator = Paginator(post_list, POSTS_PER_PAGE)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
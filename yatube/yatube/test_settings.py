@@ -0,0 +1,17 @@
+"""Настройки для запуска тестов.
+
+Отличаются от боевых только кэширующим загрузчиком шаблонов:
+без него каждый client.get в тестах компилирует шаблон заново.
+Использование: ./manage.py test --settings=yatube.test_settings
+(pytest берёт этот модуль из pytest.ini).
+"""
+
+from .settings import *  # noqa: F401,F403
+
+TEMPLATES[0]['APP_DIRS'] = False  # noqa: F405
+TEMPLATES[0]['OPTIONS']['loaders'] = [  # noqa: F405
+    ('django.template.loaders.cached.Loader', [
+        'django.template.loaders.filesystem.Loader',
+        'django.template.loaders.app_directories.Loader',
+    ]),
+]